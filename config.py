@@ -1,5 +1,20 @@
+from dataclasses import dataclass, field
+
 CAM_X_SIZE = 640
 CAM_Y_SIZE = 480
+CAM_FPS = 30
+CAM_FOURCC = "MJPG"  # Requested pixel format; empty keeps the driver default
+CAM_BUFFER_SIZE = 1  # Keep only the newest frame queued in the camera driver
+CAM_MAX_STALE_GRABS = 4  # Buffered frames skipped per read at most
+CAM_FRESH_GRAB_SECONDS = 0.005  # A grab slower than this waited on the sensor
+CAM_RETRY_SECONDS = 0.005  # Back-off after a failed camera read
+CAM_WAIT_TIMEOUT_NS = 100_000_000  # Longest select() wait before re-checking shutdown
+CAM_POLL_TIMEOUT_NS = 1_000  # A frame ready within this was already buffered
+HAND_TRACKING_SIZE = (320, 240)  # Frame size fed to hand detection (w, h)
+MOTION_GATE_SIZE = (32, 24)  # Thumbnail compared to decide whether to re-detect
+HAND_TRACKING_MOTION_THRESHOLD = 6.0  # Largest per-cell gray-level change that triggers detection; 0 detects every frame
+HAND_TRACKING_USE_GPU = True  # Falls back to CPU when no GPU delegate is available
+GESTURE_VOTE_FRAMES = 5  # Gesture poses are a majority vote over this many frames
 WINDOW_SIZE = {"width": 1920, "height": 1080}
 
 ROAD_SIZE = {"width": 700, "height": 1080}
@@ -23,12 +38,35 @@ FRICTION = 0.01
 BRAKE_STRENGTH = 0.25
 BRAKE_SENSITIVITY = 5
 TURN_STEER_SENS = 30
+MAX_STEER = 2.0  # Absolute steering value the game loop clamps to
 BRAKE_HAZARD_FREEZE_MS = 0
 
+
+@dataclass(frozen=True, slots=True)
+class CarPhysics:
+    """Immutable car tuning, with derived values resolved once at creation."""
+
+    acceleration: float = ACCELERATION
+    friction: float = FRICTION
+    brake_strength: float = BRAKE_STRENGTH
+    turn_steer_sens: float = TURN_STEER_SENS
+    max_steer: float = MAX_STEER
+    min_effective_speed: float = 2.0  # Lets a stopped car still steer
+    max_turn_angle: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "max_turn_angle", self.max_steer * self.turn_steer_sens
+        )
+
+
+CAR_PHYSICS = CarPhysics()
+
 # Traffic vehicle scaling
 TRAFFIC_LANE_WIDTH_RATIO = 0.28
 TRAFFIC_MIN_SIZE = 20
 TRAFFIC_MAX_SOURCE_SCALE = 0.75
+MODEL_SCALE_CACHE_SIZE = 32  # Scaled model sprites kept per spawn manager
 
 # Road crack hazards
 CRACK_SPAWN_FREQUENCY = 300
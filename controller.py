@@ -1,19 +1,30 @@
 import logging
-import os
+import queue
+import sys
 import threading
 import time
+from collections import deque
 from threading import Thread
 
 import cv2
 import mediapipe as mp
+import numpy as np
 from mediapipe.tasks.python import BaseOptions, vision
 from mediapipe.tasks.python.vision.hand_landmarker import HandLandmarkerOptions
 
 import config
+import hand_gestures
 
-os.makedirs("logs", exist_ok=True)
 logger = logging.getLogger(__name__)
 
+# Hand skeleton as an (N, 2) index array built once at import; indexing a
+# hand's (21, 2) pixel array with it yields every bone segment as (N, 2, 2).
+_HAND_BONES = np.asarray(config.HAND_CONNECTIONS, dtype=np.int32)
+
+# Open the camera through V4L2 directly on Linux; CAP_ANY may pick GStreamer,
+# which adds its own buffering and hides the device fd polled in `_capture`.
+_CAMERA_API = cv2.CAP_V4L2 if sys.platform.startswith("linux") else cv2.CAP_ANY
+
 
 class Controller:
     """
@@ -27,19 +38,39 @@ class Controller:
         """
         Initialize camera control and hand tracking state.
 
-        Sets defaults for steering/braking, creates the MediaPipe hand landmarker,
-        and prepares synchronization primitives for the capture thread.
+        Sets defaults for steering/braking, creates the MediaPipe hand landmarker
+        (on the GPU delegate when available), and prepares synchronization
+        primitives for the capture thread.
         """
         self.cap: cv2.VideoCapture | None = None
         self.running = False
         self.latest_result = None
+        # Landmark arrays converted from `_hand_arrays_result`.
+        self._hand_arrays_result = None
+        self._hand_arrays_cache: list[np.ndarray] = []
         self.steer = 0.0
         self.breaking = False
         self.brake_threshold = 0.02
         self.current_frame = None
-        self.annotated_frame = None
-        self.lock = threading.Lock()
+        # Single-item channel to the game loop; the newest frame replaces an
+        # unread one. `_last_frame` is what `get_frame` hands out between
+        # updates.
+        self._frame_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._last_frame = None
         self.thread: Thread | None = None
+        self.capture_thread: Thread | None = None
+        self._poll_camera = False
+        # Single-slot handoff from the capture thread to the detection thread;
+        # a newer frame overwrites one that was not processed yet.
+        self._raw_frame = None
+        self._raw_frame_ready = threading.Condition()
+        # Resize, mirror, and RGB conversion targets reused across frames;
+        # mp.Image copies the last one.
+        self._detect_buffer = None
+        self._flip_buffer = None
+        self._rgb_buffer = None
+        # Grayscale thumbnail of the last frame sent to the landmarker.
+        self._detected_thumb = None
         self.boosting = False
         self.shift_up_requested = False
         self.shift_down_requested = False
@@ -56,11 +87,37 @@ class Controller:
         self._prev_right_hand_y = None
         self.swipe_threshold = 0.02
         self.require_two_hands = True
-
-        self.lm = vision.HandLandmarker.create_from_options(
+        # Recent per-frame pose decisions; the published pose is their majority
+        # so single misdetections do not flip controls.
+        self._left_index_votes: deque[bool] = deque(maxlen=config.GESTURE_VOTE_FRAMES)
+        self._right_index_votes: deque[bool] = deque(maxlen=config.GESTURE_VOTE_FRAMES)
+        self._thumb_up_votes: deque[bool] = deque(maxlen=config.GESTURE_VOTE_FRAMES)
+
+        self.lm = None
+        if config.HAND_TRACKING_USE_GPU:
+            try:
+                self.lm = self._create_landmarker(BaseOptions.Delegate.GPU)
+                logger.info("Hand landmarker using GPU delegate.")
+            except (RuntimeError, NotImplementedError) as exc:
+                # MediaPipe raises NotImplementedError on platforms without a
+                # GPU delegate (Windows, macOS) and RuntimeError when setup fails.
+                logger.warning("GPU delegate unavailable, using CPU: %s", exc)
+        if self.lm is None:
+            self.lm = self._create_landmarker(BaseOptions.Delegate.CPU)
+
+    def _create_landmarker(self, delegate):
+        """
+        Create the live-stream MediaPipe hand landmarker on the given delegate.
+
+        Raises:
+            RuntimeError: If MediaPipe cannot initialize the delegate.
+            NotImplementedError: If the delegate is not supported on this platform.
+        """
+        return vision.HandLandmarker.create_from_options(
             HandLandmarkerOptions(
                 base_options=BaseOptions(
                     model_asset_path="resources/hand_landmarker.task",
+                    delegate=delegate,
                 ),
                 num_hands=2,
                 running_mode=vision.RunningMode.LIVE_STREAM,
@@ -73,16 +130,43 @@ class Controller:
 
     def start_stream(self):
         """
-        Start the camera capture and processing thread.
+        Start the camera capture and processing threads.
 
-        Opens the default camera device, configures its resolution, and launches
-        the background update loop that performs hand detection.
+        Opens the default camera device, configures its resolution, frame rate,
+        and buffering, then launches a capture thread that only reads frames
+        and a processing thread that runs hand detection on the newest one.
         """
-        self.cap = cv2.VideoCapture(0)
+        self.cap = cv2.VideoCapture(0, _CAMERA_API)
+        if not self.cap.isOpened() and _CAMERA_API != cv2.CAP_ANY:
+            # Some devices only open through another backend (e.g. GStreamer).
+            logger.warning("Camera did not open with V4L2; retrying with CAP_ANY.")
+            self.cap.release()
+            self.cap = cv2.VideoCapture(0, cv2.CAP_ANY)
+        # A one-frame driver queue keeps detection on the newest frame instead
+        # of working through frames buffered while inference was busy.
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, config.CAM_BUFFER_SIZE)
+        # Compressed MJPEG fits higher frame rates through USB bandwidth than
+        # raw YUYV; the format must be chosen before the resolution.
+        if config.CAM_FOURCC:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.CAM_FOURCC))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.CAM_X_SIZE)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAM_Y_SIZE)
+        self.cap.set(cv2.CAP_PROP_FPS, config.CAM_FPS)
+        fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        logger.info(
+            "Camera format: %s",
+            fourcc.to_bytes(4, "little").decode("ascii", "replace") if fourcc else "unknown",
+        )
+        # V4L2 devices expose a pollable fd, so the capture thread can sleep in
+        # select() until a frame lands instead of blocking inside grab().
+        try:
+            self._poll_camera = self.cap.getBackendName() == "V4L2"
+        except cv2.error:
+            self._poll_camera = False
         self.running = True
+        self.capture_thread = threading.Thread(target=self._capture, daemon=True)
         self.thread = threading.Thread(target=self._update, daemon=True)
+        self.capture_thread.start()
         self.thread.start()
         logger.info("Camera thread started.")
 
@@ -90,44 +174,199 @@ class Controller:
         """
         Stop the camera capture and clean up resources.
 
-        Signals the update loop to exit, joins the thread, and releases the
+        Signals both loops to exit, joins the threads, and releases the
         camera handle if it is open.
         """
         if self.thread is None or not self.thread.is_alive():
             return
         self.running = False
-        if self.thread.is_alive():
-            self.thread.join()
+        with self._raw_frame_ready:
+            self._raw_frame_ready.notify_all()
+        for thread in (self.capture_thread, self.thread):
+            if thread is not None and thread.is_alive():
+                thread.join()
 
         if self.cap is not None:
             self.cap.release()
         logger.info("Camera thread stopped.")
 
-    def _update(self):
+    def _capture(self):
         """
-        Capture frames and run asynchronous hand detection.
+        Read camera frames into the single-slot handoff.
 
-        Reads frames from the camera, flips them for a mirror view, and submits
-        them to MediaPipe. The latest annotated frame is stored for rendering.
+        Runs on its own thread so waiting on the camera overlaps with hand
+        detection on the previous frame.
         """
-        start_time = time.time()
         while self.running:
-            ret, frame = self.cap.read()
+            ret, frame = self._read_latest_frame()
             if not ret:
+                if not self.running:
+                    break
                 logger.error("Failed to read frame from camera.")
+                # Yield instead of spinning while the device recovers.
+                time.sleep(config.CAM_RETRY_SECONDS)
+                continue
+
+            with self._raw_frame_ready:
+                self._raw_frame = frame
+                self._raw_frame_ready.notify()
+
+    def _update(self):
+        """
+        Run asynchronous hand detection on the newest captured frame.
+
+        Takes frames from the capture thread, flips them for a mirror view, and
+        submits them to MediaPipe. The latest annotated frame is stored for
+        rendering.
+        """
+        start_ns = time.monotonic_ns()
+        last_timestamp_ms = -1
+        while self.running:
+            with self._raw_frame_ready:
+                while self._raw_frame is None and self.running:
+                    self._raw_frame_ready.wait()
+                frame = self._raw_frame
+                self._raw_frame = None
+            if frame is None:
+                continue
+
+            # LIVE_STREAM needs strictly increasing timestamps; the monotonic
+            # clock cannot jump back, and two frames in one millisecond are
+            # nudged apart.
+            timestamp_ms = max(
+                (time.monotonic_ns() - start_ns) // 1_000_000, last_timestamp_ms + 1
+            )
+            last_timestamp_ms = timestamp_ms
+            # Landmarks come back normalized, so detection can run on a smaller
+            # copy while the full-size frame is kept for annotation. Resizing
+            # first means the mirror flip only touches the small frame.
+            detect_frame = frame
+            if (frame.shape[1], frame.shape[0]) != config.HAND_TRACKING_SIZE:
+                detect_frame = cv2.resize(
+                    frame,
+                    config.HAND_TRACKING_SIZE,
+                    dst=self._detect_buffer,
+                    interpolation=cv2.INTER_AREA,
+                )
+                self._detect_buffer = detect_frame
+            if self._flip_buffer is None or self._flip_buffer.shape != detect_frame.shape:
+                self._flip_buffer = np.empty_like(detect_frame)
+                self._rgb_buffer = np.empty_like(detect_frame)
+            cv2.flip(detect_frame, 1, dst=self._flip_buffer)
+            if self._scene_changed(self._flip_buffer):
+                self._submit_detection(self._flip_buffer, timestamp_ms)
+
+            # Gesture state updates every frame, but drawing only happens once
+            # the game has taken the previous frame; otherwise it would be
+            # thrown away unseen, so it is not mirrored either.
+            draw = self._frame_queue.empty()
+            if draw:
+                cv2.flip(frame, 1, dst=frame)
+            annotated = self._draw_annotations_internal(frame, draw=draw)
+            if not draw:
                 continue
+            # Each captured frame is a fresh array that is drawn on in place, so
+            # a published frame is never touched again and readers can share it
+            # without a copy.
+            annotated.flags.writeable = False
+            self._frame_queue.put_nowait(annotated)
+
+    def _scene_changed(self, frame) -> bool:
+        """
+        Return whether `frame` differs enough from the last detected frame.
+
+        Compares tiny grayscale thumbnails; when no cell changes by
+        `config.HAND_TRACKING_MOTION_THRESHOLD` or more the previous landmarks
+        still describe the scene and inference can be skipped. Gating on the
+        largest cell change rather than the mean keeps a small hand tilt from
+        being averaged away by the static background. Comparing against the
+        last *detected* frame keeps slow drift from slipping through.
 
-            frame = cv2.flip(frame, 1)
+        Args:
+            frame: BGR detection frame.
 
-            timestamp_ms = int((time.time() - start_time) * 1000)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-            self.lm.detect_async(mp_image, timestamp_ms)
+        Returns:
+            bool: True if the frame should be sent to the landmarker.
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, config.MOTION_GATE_SIZE, interpolation=cv2.INTER_AREA)
+        reference = self._detected_thumb
+        if reference is not None:
+            change = cv2.norm(thumb, reference, cv2.NORM_INF)
+            if change < config.HAND_TRACKING_MOTION_THRESHOLD:
+                return False
+        self._detected_thumb = thumb
+        return True
+
+    def _submit_detection(self, frame, timestamp_ms: int) -> None:
+        """
+        Convert a BGR detection frame to RGB and queue it for MediaPipe.
+
+        Args:
+            frame: Mirrored BGR frame at `config.HAND_TRACKING_SIZE`.
+            timestamp_ms: Strictly increasing frame timestamp.
+        """
+        # cvtColor is the fastest way to get a contiguous RGB buffer here:
+        # mp.Image misreads a reversed-channel view (frame[..., ::-1]) and
+        # np.ascontiguousarray on that view is several times slower.
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        # mp.Image copies `data` on construction, so the buffers can be
+        # overwritten next frame while MediaPipe still works on this one.
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buffer)
+        self.lm.detect_async(mp_image, timestamp_ms)
+
+    def _read_latest_frame(self):
+        """
+        Grab past buffered frames and decode only the newest one.
+
+        A grab that returns almost immediately came from the driver buffer, so
+        keep grabbing; one that had to wait on the sensor is fresh. Skipped
+        frames are never decoded.
+
+        Returns:
+            tuple[bool, numpy.ndarray | None]: Same as `cv2.VideoCapture.read`.
+        """
+        if self._poll_camera:
+            try:
+                return self._read_when_ready()
+            except cv2.error:
+                logger.warning("Camera backend cannot be polled; using blocking reads.")
+                self._poll_camera = False
+        for _ in range(config.CAM_MAX_STALE_GRABS):
+            grab_start = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if time.perf_counter() - grab_start > config.CAM_FRESH_GRAB_SECONDS:
+                break
+        return self.cap.retrieve()
+
+    def _read_when_ready(self):
+        """
+        Wait on the camera fd for a frame, then decode only the newest one.
+
+        `cv2.VideoCapture.waitAny` selects on the device and grabs the frame
+        once it is ready. The wait is bounded so `stop_stream` is noticed
+        promptly; streams that are ready again immediately were still
+        buffered and get skipped.
 
-            annotated = self._draw_annotations_internal(frame)
+        Returns:
+            tuple[bool, numpy.ndarray | None]: Same as `cv2.VideoCapture.read`.
 
-            with self.lock:
-                self.annotated_frame = annotated
+        Raises:
+            cv2.error: If the capture backend does not support polling.
+        """
+        streams = [self.cap]
+        while self.running:
+            ready, _ = cv2.VideoCapture.waitAny(streams, config.CAM_WAIT_TIMEOUT_NS)
+            if ready:
+                break
+        else:
+            return False, None
+        for _ in range(config.CAM_MAX_STALE_GRABS - 1):
+            ready, _ = cv2.VideoCapture.waitAny(streams, config.CAM_POLL_TIMEOUT_NS)
+            if not ready:
+                break
+        return self.cap.retrieve()
 
     def callback(self, result, output_image, timestamp_ms):
         """
@@ -162,16 +401,25 @@ class Controller:
         self._prev_question_select_active = False
         self._question_select_closed_frames = 0
         self._prev_right_hand_y = None
+        self._left_index_votes.clear()
+        self._right_index_votes.clear()
+        self._thumb_up_votes.clear()
 
-    def _resolve_left_right_hands(self):
+    @staticmethod
+    def _vote(votes: deque, detected: bool) -> bool:
+        """Record one frame's decision and return the majority over the window."""
+        votes.append(bool(detected))
+        return 2 * sum(votes) > votes.maxlen
+
+    @staticmethod
+    def _resolve_left_right_indices(result) -> tuple[int, int]:
         """
-        Return landmarks ordered as `(left_hand, right_hand)`.
+        Return detector indices of the hands as `(left_index, right_index)`.
 
         Uses MediaPipe handedness labels when present; otherwise falls back to
         detector order.
         """
-        hand_landmarks = self.latest_result.hand_landmarks
-        handedness = getattr(self.latest_result, "handedness", None)
+        handedness = getattr(result, "handedness", None)
         left_idx = 0
         right_idx = 1
         if handedness and len(handedness) >= 2:
@@ -183,7 +431,7 @@ class Controller:
                     left_idx = i
                 elif side == "right":
                     right_idx = i
-        return hand_landmarks[left_idx], hand_landmarks[right_idx]
+        return left_idx, right_idx
 
     @staticmethod
     def _landmark_point(landmark) -> tuple[float, float]:
@@ -192,59 +440,20 @@ class Controller:
         """
         return landmark.x, landmark.y
 
-    @staticmethod
-    def _is_index_only(hand_landmarks) -> bool:
-        """
-        Detect a "pointer finger" gesture for L1/R1 style shifting.
-
-        The index finger must be extended while most other fingers stay curled.
-        """
-        index_tip = hand_landmarks[8]
-        index_pip = hand_landmarks[6]
-        index_mcp = hand_landmarks[5]
-        index_extended = index_tip.y < index_pip.y and index_pip.y < index_mcp.y
-        curled_count = 0
-        for tip_i, pip_i in zip([12, 16, 20], [10, 14, 18]):
-            if hand_landmarks[tip_i].y > hand_landmarks[pip_i].y:
-                curled_count += 1
-        return index_extended and curled_count >= 2
-
-    @staticmethod
-    def _is_thumb_up(hand_landmarks) -> bool:
-        """
-        Detect a thumbs-up gesture used to trigger boost.
-        """
-        thumb_tip = hand_landmarks[4]
-        thumb_mcp = hand_landmarks[2]
-        thumb_up = thumb_tip.y < thumb_mcp.y
-        curled = 0
-        for tip_i, pip_i in zip([8, 12, 16, 20], [6, 10, 14, 18]):
-            if hand_landmarks[tip_i].y > hand_landmarks[pip_i].y:
-                curled += 1
-        return thumb_up and curled >= 3
-
-    @staticmethod
-    def _is_index_closed(hand_landmarks) -> bool:
-        """Detect a deliberate "index finger down" pose with stricter checks."""
-        index_tip = hand_landmarks[8]
-        index_pip = hand_landmarks[6]
-        index_mcp = hand_landmarks[5]
-
-        tip_below_pip = index_tip.y > (index_pip.y + 0.03)
-        tip_below_mcp = index_tip.y > (index_mcp.y + 0.05)
-        pip_below_mcp = index_pip.y > (index_mcp.y + 0.01)
-
-        return tip_below_pip and tip_below_mcp and pip_below_mcp
-
-    def _update_shift_state(self, left_hand, right_hand) -> None:
+    def _update_shift_state(self, left_index_only: bool, right_index_only: bool) -> None:
         """
         Update sustained shift poses and one-shot shift requests.
 
-        Active poses (`left_shift_active`, `right_shift_active`) are continuous.
-        Requests are rising-edge pulses consumed by the game loop.
+        Active poses (`left_shift_active`, `right_shift_active`) are continuous
+        and majority-voted over recent frames. Requests are rising-edge pulses
+        of the voted poses, consumed by the game loop.
+
+        Args:
+            left_index_only: Whether the left hand shows the pointer pose.
+            right_index_only: Whether the right hand shows the pointer pose.
         """
-        self.left_shift_active = self._is_index_only(left_hand)
-        self.right_shift_active = self._is_index_only(right_hand)
+        self.left_shift_active = self._vote(self._left_index_votes, left_index_only)
+        self.right_shift_active = self._vote(self._right_index_votes, right_index_only)
         self.shift_down_requested = (
                 self.left_shift_active and not self._prev_left_shift_active
         )
@@ -254,14 +463,6 @@ class Controller:
         self._prev_left_shift_active = self.left_shift_active
         self._prev_right_shift_active = self.right_shift_active
 
-    @staticmethod
-    def _compute_steer(left_wrist, right_wrist) -> float:
-        """
-        Compute clamped steering slope from wrist alignment.
-        """
-        slope = (right_wrist.y - left_wrist.y) / (right_wrist.x - left_wrist.x + 1e-6)
-        return max(-5.0, min(5.0, slope))
-
     def _draw_status_overlays(self, image, normalized_slope: float) -> None:
         """
         Draw textual overlays for steer, throttle/brake, and shift feedback.
@@ -305,28 +506,39 @@ class Controller:
             2,
         )
 
-    def _draw_hand_graphics(self, image, left_wrist, right_wrist) -> None:
+    @staticmethod
+    def _draw_hand_graphics(image, hand_pixels, left_index=None, right_index=None) -> None:
         """
-        Draw wrist connector plus full hand skeleton/landmark points.
+        Draw full hand skeletons/landmark points, plus the wrist connector.
+
+        Args:
+            image: Frame to draw on.
+            hand_pixels: One `(21, 2)` int32 pixel array per detected hand.
+            left_index: Index of the left hand, if the wrists should be joined.
+            right_index: Index of the right hand, if the wrists should be joined.
         """
+        if left_index is not None and right_index is not None:
+            cv2.line(
+                image,
+                hand_pixels[left_index][hand_gestures.WRIST].tolist(),
+                hand_pixels[right_index][hand_gestures.WRIST].tolist(),
+                (0, 255, 0),
+                2,
+            )
+        # Each bone is a two-point open polyline, so one call draws every bone.
+        bones = np.concatenate([pixels[_HAND_BONES] for pixels in hand_pixels])
+        cv2.polylines(image, bones, False, (0, 255, 0), 2)
+        # A zero-length segment 10px thick rasterizes exactly like a filled
+        # radius-5 circle, so every joint is drawn in the same single call.
+        joints = np.concatenate(hand_pixels)[:, np.newaxis, :].repeat(2, axis=1)
+        cv2.polylines(image, joints, False, (0, 255, 0), 10)
+
+    @staticmethod
+    def _to_pixels(image, hand_arrays) -> list[np.ndarray]:
+        """Scale normalized `(21, 2)` landmark arrays to int32 pixel coordinates."""
         h, w, _ = image.shape
-        cv2.line(
-            image,
-            (int(left_wrist.x * w), int(left_wrist.y * h)),
-            (int(right_wrist.x * w), int(right_wrist.y * h)),
-            (0, 255, 0),
-            2,
-        )
-        for hand_landmarks in self.latest_result.hand_landmarks:
-            for a, b in config.HAND_CONNECTIONS:
-                la = hand_landmarks[a]
-                lb = hand_landmarks[b]
-                ax, ay = int(la.x * w), int(la.y * h)
-                bx, by = int(lb.x * w), int(lb.y * h)
-                cv2.line(image, (ax, ay), (bx, by), (0, 255, 0), 2)
-            for landmark in hand_landmarks:
-                cx, cy = int(landmark.x * w), int(landmark.y * h)
-                cv2.circle(image, (cx, cy), 5, (0, 255, 0), -1)
+        scale = np.array((w, h), dtype=np.float64)
+        return [(lm * scale).astype(np.int32) for lm in hand_arrays]
 
     def _detect_swipes(self, right_hand) -> None:
         """
@@ -334,9 +546,11 @@ class Controller:
         
         Compares current hand position to previous position. If hand moved up/down
         beyond the swipe threshold, trigger the appropriate gesture.
+
+        Args:
+            right_hand: Hand landmarks as a `(21, 2)` array.
         """
-        right_palm = right_hand[0]
-        current_y = right_palm.y
+        current_y = float(right_hand[hand_gestures.WRIST, 1])
         
         self.swipe_up_detected = False
         self.swipe_down_detected = False
@@ -350,29 +564,52 @@ class Controller:
         
         self._prev_right_hand_y = current_y
 
-    def _process_two_hands(self, image) -> None:
+    def _hand_arrays(self, result) -> list[np.ndarray]:
+        """
+        Return one `(21, 2)` landmark array per hand in `result`.
+
+        Detection usually runs slower than the camera, so the same result is
+        processed for several frames; it is converted only the first time.
+        """
+        if result is not self._hand_arrays_result:
+            self._hand_arrays_cache = [
+                hand_gestures.landmarks_to_array(hand) for hand in result.hand_landmarks
+            ]
+            self._hand_arrays_result = result
+        return self._hand_arrays_cache
+
+    def _process_two_hands(self, image, result, draw: bool = True) -> None:
         """
         Derive control states from two valid detected hands and annotate frame.
         """
-        left_hand, right_hand = self._resolve_left_right_hands()
-        left_wrist = left_hand[0]
-        right_wrist = right_hand[0]
+        left_index, right_index = self._resolve_left_right_indices(result)
+        # Gesture predicates and drawing share one array per hand instead of
+        # re-reading landmark attributes.
+        hand_arrays = self._hand_arrays(result)
+        left_lm = hand_arrays[left_index]
+        right_lm = hand_arrays[right_index]
+
+        left_index_only, right_index_only, left_thumb_up, normalized_slope = (
+            hand_gestures.classify_two_hands(left_lm, right_lm)
+        )
 
         self.breaking = not self.left_shift_active and not self.right_shift_active
-        self._update_shift_state(left_hand, right_hand)
-        self.boosting = self._is_thumb_up(left_hand)  # Left hand only for boost.
-        self._detect_swipes(right_hand)
+        self._update_shift_state(left_index_only, right_index_only)
+        # Left hand only for boost.
+        self.boosting = self._vote(self._thumb_up_votes, left_thumb_up)
+        self._detect_swipes(right_lm)
 
-        normalized_slope = self._compute_steer(left_wrist, right_wrist)
         self.steer = 0.0 if self.breaking else normalized_slope
 
-        self._draw_status_overlays(image, normalized_slope)
-        self._draw_hand_graphics(image, left_wrist, right_wrist)
+        if draw:
+            self._draw_status_overlays(image, normalized_slope)
+            self._draw_hand_graphics(
+                image, self._to_pixels(image, hand_arrays), left_index, right_index
+            )
 
-    def _process_question_hands(self, image) -> None:
+    def _process_question_hands(self, image, result, draw: bool = True) -> None:
         """Process gestures for question mode where one hand is sufficient."""
-        hands = self.latest_result.hand_landmarks
-        if not hands:
+        if not result.hand_landmarks:
             self.swipe_up_detected = False
             self.swipe_down_detected = False
             self.question_select_requested = False
@@ -381,9 +618,9 @@ class Controller:
             self._prev_right_hand_y = None
             return
 
-        primary_hand = hands[0]
-        self._detect_swipes(primary_hand)
-        index_closed = any(self._is_index_closed(hand) for hand in hands)
+        hand_arrays = self._hand_arrays(result)
+        self._detect_swipes(hand_arrays[0])
+        index_closed = any(hand_gestures.is_index_closed(lm) for lm in hand_arrays)
 
         if index_closed:
             self._question_select_closed_frames += 1
@@ -406,47 +643,46 @@ class Controller:
         self.right_shift_active = False
         self.boosting = False
 
-        h, w, _ = image.shape
-        for hand_landmarks in hands:
-            for a, b in config.HAND_CONNECTIONS:
-                la = hand_landmarks[a]
-                lb = hand_landmarks[b]
-                ax, ay = int(la.x * w), int(la.y * h)
-                bx, by = int(lb.x * w), int(lb.y * h)
-                cv2.line(image, (ax, ay), (bx, by), (0, 255, 0), 2)
-            for landmark in hand_landmarks:
-                cx, cy = int(landmark.x * w), int(landmark.y * h)
-                cv2.circle(image, (cx, cy), 5, (0, 255, 0), -1)
-
-    def _draw_annotations_internal(self, image):
+        if draw:
+            self._draw_hand_graphics(image, self._to_pixels(image, hand_arrays))
+
+    def _draw_annotations_internal(self, image, draw: bool = True):
         """
         Process the latest detection result and return an annotated frame.
 
         Enforces the two-hand requirement, updates control state from gestures,
         and draws overlays used by the in-game camera preview.
+
+        Args:
+            image: Frame to annotate in place.
+            draw: When False, only control state is updated and nothing is drawn.
         """
-        if not (self.latest_result and self.latest_result.hand_landmarks):
+        # The callback may swap in a new result at any time; use one snapshot
+        # for the whole pass.
+        result = self.latest_result
+        if not (result and result.hand_landmarks):
             self._reset_controls()
             return image
 
-        hand_count = len(self.latest_result.hand_landmarks)
+        hand_count = len(result.hand_landmarks)
         if self.require_two_hands and hand_count != 2:
-            cv2.putText(
-                image,
-                "Must be 2 hands",
-                (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                1,
-                (0, 0, 255),
-                2,
-            )
+            if draw:
+                cv2.putText(
+                    image,
+                    "Must be 2 hands",
+                    (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    1,
+                    (0, 0, 255),
+                    2,
+                )
             self._reset_controls()
             return image
 
         if self.require_two_hands:
-            self._process_two_hands(image)
+            self._process_two_hands(image, result, draw)
         else:
-            self._process_question_hands(image)
+            self._process_question_hands(image, result, draw)
 
         return image
 
@@ -486,10 +722,12 @@ class Controller:
         """
         Return the most recent annotated frame.
 
-        Provides a copy of the latest frame to avoid threading issues. Returns
-        None if no frame is available yet.
+        The frame is shared, not copied: it is read-only and the capture
+        thread replaces it with a new array instead of drawing over it. Copy it
+        before making changes. Returns None if no frame is available yet.
         """
-        with self.lock:
-            if self.annotated_frame is not None:
-                return self.annotated_frame.copy()
-            return None
+        try:
+            self._last_frame = self._frame_queue.get_nowait()
+        except queue.Empty:
+            pass
+        return self._last_frame
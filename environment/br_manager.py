@@ -8,6 +8,13 @@ from models.br_hazard import BRHazard
 from models.lane import Lane
 from models.road import Road
 from environment.obstacle_manager import ObstacleManager
+from environment.spawn_support import (
+    ScaledModelCache,
+    column_rect,
+    scroll_with_map,
+    spacing_rect,
+    sprite_rects,
+)
 
 
 class BRManager:
@@ -26,7 +33,10 @@ class BRManager:
         self.timer = 0
         self.model_dir = Path("resources/models/obstacles")
         self.br_models = self._load_br_models()
-        self.model_scale_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self.model_cache = ScaledModelCache(
+            self.br_models, config.BR_LANE_WIDTH_RATIO, min_height=20
+        )
+        self.model_cache.prewarm(self.road)
         self.blocking_groups: list[pygame.sprite.Group] = []
 
     def set_blocking_groups(self, groups: list[pygame.sprite.Group]) -> None:
@@ -53,25 +63,12 @@ class BRManager:
             return None
 
         model_index = random.randrange(len(self.br_models))
-        source = self.br_models[model_index]
-
-        lane_fit_width = max(1, lane.width - 20)
-        target_width = min(lane_fit_width, int(lane.width * config.BR_LANE_WIDTH_RATIO))
-        target_width = max(config.TRAFFIC_MIN_SIZE, target_width)
-
-        cache_key = (model_index, target_width)
-        cached = self.model_scale_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        source_width, source_height = source.get_size()
-        scaled_height = max(20, int(source_height * (target_width / source_width)))
-        scaled = pygame.transform.smoothscale(source, (target_width, scaled_height))
-        self.model_scale_cache[cache_key] = scaled
-        return scaled
+        return self.model_cache.scaled(model_index, lane)
 
     def _spawn_br(self) -> None:
         max_attempts = 10
+        br_rects = sprite_rects(self.brs)
+        blocking_rects = sprite_rects(*self.blocking_groups)
         for _ in range(max_attempts):
             lane = self.road.random_lane()
             br_image = self._get_random_br_image(lane)
@@ -88,29 +85,14 @@ class BRManager:
             )
             spawn_y = -br_height - random.randint(40, 220)
 
-            overlap = False
-            for br in self.brs:
-                if (
-                        br.rect.left < spawn_x + br_width
-                        and br.rect.right > spawn_x
-                        and abs(br.rect.y - spawn_y) < br_height * 3
-                ):
-                    overlap = True
-                    break
-
-            if not overlap:
-                spawn_rect = pygame.Rect(spawn_x, spawn_y, br_width, br_height)
-                for group in self.blocking_groups:
-                    for blocked_sprite in group:
-                        if (
-                                spawn_rect.left < blocked_sprite.rect.right
-                                and spawn_rect.right > blocked_sprite.rect.left
-                        ):
-                            overlap = True
-                            break
-                    if overlap:
-                        break
-            if not overlap:
+            # Other BRs must stay about three heights away vertically; sprites
+            # in the blocking groups may not share the column at any height.
+            spacing = spacing_rect(spawn_x, spawn_y, br_width, br_height)
+            column = column_rect(spawn_x, br_width)
+            if (
+                    spacing.collidelist(br_rects) < 0
+                    and column.collidelist(blocking_rects) < 0
+            ):
                 break
 
         br = BRHazard(spawn_x, spawn_y, br_width, br_height, image=br_image)
@@ -123,7 +105,7 @@ class BRManager:
             if len(self.brs) < self.max_brs:
                 self._spawn_br()
 
-        self.brs.update(map_speed, self.road.height)
+        scroll_with_map(self.brs, map_speed, self.road.height)
 
     def draw(self, surface: pygame.Surface) -> None:
         self.brs.draw(surface)
@@ -8,6 +8,7 @@ from models.crack import Crack
 from models.lane import Lane
 from models.road import Road
 from environment.obstacle_manager import ObstacleManager
+from environment.spawn_support import ScaledModelCache, scroll_with_map
 
 
 class CrackManager:
@@ -26,7 +27,10 @@ class CrackManager:
         self.timer = 0
         self.model_dir = Path("resources/models/obstacles")
         self.crack_models = self._load_crack_models()
-        self.model_scale_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self.model_cache = ScaledModelCache(
+            self.crack_models, config.CRACK_LANE_WIDTH_RATIO, min_height=12
+        )
+        self.model_cache.prewarm(self.road)
 
     def _load_crack_models(self) -> list[pygame.Surface]:
         """Load crack sprites from the obstacle resource directory."""
@@ -49,23 +53,7 @@ class CrackManager:
             return None
 
         model_index = random.randrange(len(self.crack_models))
-        source = self.crack_models[model_index]
-        lane_fit_width = max(1, lane.width - 20)
-        target_width = min(
-            lane_fit_width, int(lane.width * config.CRACK_LANE_WIDTH_RATIO)
-        )
-        target_width = max(config.TRAFFIC_MIN_SIZE, target_width)
-
-        cache_key = (model_index, target_width)
-        cached = self.model_scale_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        source_width, source_height = source.get_size()
-        scaled_height = max(12, int(source_height * (target_width / source_width)))
-        scaled = pygame.transform.smoothscale(source, (target_width, scaled_height))
-        self.model_scale_cache[cache_key] = scaled
-        return scaled
+        return self.model_cache.scaled(model_index, lane)
 
     def _spawn_crack(self) -> None:
         lane = self.road.random_lane()
@@ -92,7 +80,7 @@ class CrackManager:
             if len(self.cracks) < self.max_cracks:
                 self._spawn_crack()
 
-        self.cracks.update(map_speed, self.road.height)
+        scroll_with_map(self.cracks, map_speed, self.road.height)
 
     def draw(self, surface: pygame.Surface) -> None:
         self.cracks.draw(surface)
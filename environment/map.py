@@ -26,6 +26,8 @@ class Map:
         self.current_score = 0
 
         self.road = Road(window_size, config.ROAD_SIZE["width"], lane_count=lane_count)
+        # Last requested lane count; main.py re-applies it every frame.
+        self.lane_count = lane_count
         self.obstacle_manager = ObstacleManager(self.road)
         self.crack_manager = CrackManager(self.road)
         self.br_manager = BRManager(self.road)
@@ -94,7 +96,15 @@ class Map:
         Returns:
             None: Mutates road lane configuration.
         """
+        if lane_count == self.lane_count:
+            return
+        self.lane_count = lane_count
         self.road.set_lane_count(lane_count)
+        # Scale sprites for the new lane widths now, not on first spawn.
+        self.obstacle_manager.model_cache.prewarm(self.road)
+        self.crack_manager.model_cache.prewarm(self.road)
+        self.br_manager.model_cache.prewarm(self.road)
+        self.oil_spill_manager.model_cache.prewarm(self.road)
 
     def update_score(self, score: int) -> None:
         """
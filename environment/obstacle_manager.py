@@ -7,6 +7,12 @@ import config
 from models.lane import Lane
 from models.obstacle import Obstacle
 from models.road import Road
+from environment.spawn_support import (
+    ScaledModelCache,
+    column_rect,
+    spacing_rect,
+    sprite_rects,
+)
 
 
 class ObstacleManager:
@@ -35,8 +41,14 @@ class ObstacleManager:
         self.timer = 0
         self.spawn_frequency = max(1, int(spawn_frequency))
         self.model_dir = Path("resources/models")
-        self.model_scale_cache: dict[tuple[int, int], pygame.Surface] = {}
         self.obstacle_models = self._load_obstacle_models()
+        self.model_cache = ScaledModelCache(
+            self.obstacle_models,
+            config.TRAFFIC_LANE_WIDTH_RATIO,
+            min_height=config.TRAFFIC_MIN_SIZE,
+            max_source_scale=config.TRAFFIC_MAX_SOURCE_SCALE,
+        )
+        self.model_cache.prewarm(self.road)
         self.blocking_groups: list[pygame.sprite.Group] = []
 
     def set_blocking_groups(self, groups: list[pygame.sprite.Group]) -> None:
@@ -73,33 +85,7 @@ class ObstacleManager:
             return None
 
         model_index = random.randrange(len(self.obstacle_models))
-        source = self.obstacle_models[model_index]
-
-        lane_fit_width = max(1, lane.width - 20)
-        target_width = min(
-            lane_fit_width, int(lane.width * config.TRAFFIC_LANE_WIDTH_RATIO)
-        )
-        target_width = max(config.TRAFFIC_MIN_SIZE, target_width)
-        target_width = min(
-            target_width,
-            max(
-                config.TRAFFIC_MIN_SIZE,
-                int(source.get_width() * config.TRAFFIC_MAX_SOURCE_SCALE),
-            ),
-        )
-
-        cache_key = (model_index, target_width)
-        cached = self.model_scale_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        source_width, source_height = source.get_size()
-        scaled_height = max(
-            config.TRAFFIC_MIN_SIZE, int(source_height * (target_width / source_width))
-        )
-        scaled = pygame.transform.smoothscale(source, (target_width, scaled_height))
-        self.model_scale_cache[cache_key] = scaled
-        return scaled
+        return self.model_cache.scaled(model_index, lane)
 
     @staticmethod
     def _lane_spawn_x(lane: Lane, obstacle_width: int, min_padding: int = 10) -> int:
@@ -146,6 +132,8 @@ class ObstacleManager:
         """
         # Avoid spawning in a lane that already has an obstacle near the top
         max_attempts = 10
+        obstacle_rects = sprite_rects(self.obstacles)
+        blocking_rects = sprite_rects(*self.blocking_groups)
         for _ in range(max_attempts):
             lane = self.road.get_lane(self.road.lane_count // 2)
             obstacle_image = self._get_random_obstacle_image(lane)
@@ -160,33 +148,14 @@ class ObstacleManager:
             # Spawn just above the screen for smooth entry
             spawn_y = -obstacle_height - random.randint(0, 100)
 
-            # Check for overlap with existing obstacles in the same lane
-            overlap = False
-            for obs in self.obstacles:
-                # Check if obs is in the same lane (by x overlap)
-                if (
-                        obs.rect.left < spawn_x + obstacle_width
-                        and obs.rect.right > spawn_x
-                        and abs(obs.rect.y - spawn_y) < obstacle_height * 3
-                ):
-                    overlap = True
-                    break
-
-            if not overlap:
-                spawn_rect = pygame.Rect(
-                    spawn_x, spawn_y, obstacle_width, obstacle_height
-                )
-                for group in self.blocking_groups:
-                    for blocked_sprite in group:
-                        if (
-                                spawn_rect.left < blocked_sprite.rect.right
-                                and spawn_rect.right > blocked_sprite.rect.left
-                        ):
-                            overlap = True
-                            break
-                    if overlap:
-                        break
-            if not overlap:
+            # Keep clear of nearby obstacles in the same lane, and of blocking
+            # sprites anywhere in the column.
+            spacing = spacing_rect(spawn_x, spawn_y, obstacle_width, obstacle_height)
+            column = column_rect(spawn_x, obstacle_width)
+            if (
+                    spacing.collidelist(obstacle_rects) < 0
+                    and column.collidelist(blocking_rects) < 0
+            ):
                 break
         else:
             # If all attempts failed, just pick a random lane
@@ -5,6 +5,12 @@ import config
 import pygame
 
 from environment.obstacle_manager import ObstacleManager
+from environment.spawn_support import (
+    ScaledModelCache,
+    scroll_with_map,
+    spacing_rect,
+    sprite_rects,
+)
 from models.lane import Lane
 from models.oil_spill import OilSpill
 from models.road import Road
@@ -24,7 +30,10 @@ class OilSpillManager:
         self.timer = 0
         self.model_dir = Path("resources/models/obstacles")
         self.oil_spill_models = self._load_oil_spill_models()
-        self.model_scale_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self.model_cache = ScaledModelCache(
+            self.oil_spill_models, config.OIL_SPILL_LANE_WIDTH_RATIO, min_height=18
+        )
+        self.model_cache.prewarm(self.road)
         self.blocking_groups: list[pygame.sprite.Group] = []
 
     def set_blocking_groups(self, groups: list[pygame.sprite.Group]) -> None:
@@ -50,25 +59,11 @@ class OilSpillManager:
             return None
 
         model_index = random.randrange(len(self.oil_spill_models))
-        source = self.oil_spill_models[model_index]
-
-        lane_fit_width = max(1, lane.width - 20)
-        target_width = min(lane_fit_width, int(lane.width * config.OIL_SPILL_LANE_WIDTH_RATIO))
-        target_width = max(config.TRAFFIC_MIN_SIZE, target_width)
-
-        cache_key = (model_index, target_width)
-        cached = self.model_scale_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        source_width, source_height = source.get_size()
-        scaled_height = max(18, int(source_height * (target_width / source_width)))
-        scaled = pygame.transform.smoothscale(source, (target_width, scaled_height))
-        self.model_scale_cache[cache_key] = scaled
-        return scaled
+        return self.model_cache.scaled(model_index, lane)
 
     def _spawn_oil_spill(self) -> None:
         max_attempts = 10
+        nearby_rects = sprite_rects(self.oil_spills, *self.blocking_groups)
         for _ in range(max_attempts):
             lane = self.road.random_lane()
             oil_image = self._get_random_oil_spill_image(lane)
@@ -85,30 +80,10 @@ class OilSpillManager:
             )
             spawn_y = -oil_height - random.randint(50, 240)
 
-            overlap = False
-            for oil in self.oil_spills:
-                if (
-                        oil.rect.left < spawn_x + oil_width
-                        and oil.rect.right > spawn_x
-                        and abs(oil.rect.y - spawn_y) < oil_height * 3
-                ):
-                    overlap = True
-                    break
-
-            if not overlap:
-                spawn_rect = pygame.Rect(spawn_x, spawn_y, oil_width, oil_height)
-                for group in self.blocking_groups:
-                    for blocked_sprite in group:
-                        if (
-                                spawn_rect.left < blocked_sprite.rect.right
-                                and spawn_rect.right > blocked_sprite.rect.left
-                                and abs(blocked_sprite.rect.y - spawn_y) < oil_height * 3
-                        ):
-                            overlap = True
-                            break
-                    if overlap:
-                        break
-            if not overlap:
+            # Oil spills keep about three heights of vertical spacing from
+            # each other and from every blocking sprite in the same column.
+            spacing = spacing_rect(spawn_x, spawn_y, oil_width, oil_height)
+            if spacing.collidelist(nearby_rects) < 0:
                 break
 
         oil_spill = OilSpill(spawn_x, spawn_y, oil_width, oil_height, image=oil_image)
@@ -121,7 +96,7 @@ class OilSpillManager:
             if len(self.oil_spills) < self.max_oil_spills:
                 self._spawn_oil_spill()
 
-        self.oil_spills.update(map_speed, self.road.height)
+        scroll_with_map(self.oil_spills, map_speed, self.road.height)
 
     def draw(self, surface: pygame.Surface) -> None:
         self.oil_spills.draw(surface)
@@ -0,0 +1,157 @@
+from collections import OrderedDict
+
+import pygame
+
+import config
+from models.lane import Lane
+from models.road import Road
+
+# Half-height of the probe used for column-only overlap checks.
+_COLUMN_EXTENT = 1 << 20
+
+
+class ScaledModelCache:
+    """Bounded LRU of spawn models scaled to fit the road's lanes."""
+
+    def __init__(
+            self,
+            models: list[pygame.Surface],
+            lane_width_ratio: float,
+            min_height: int,
+            max_source_scale: float | None = None,
+    ):
+        """
+        Set up scaling rules for a manager's models.
+
+        Args:
+            models (list[pygame.Surface]): Unscaled source models.
+            lane_width_ratio (float): Sprite width as a fraction of lane width.
+            min_height (int): Smallest scaled height in pixels.
+            max_source_scale (float | None): Optional cap on upscaling,
+                relative to each source model's width.
+        """
+        self.models = models
+        self.lane_width_ratio = lane_width_ratio
+        self.min_height = min_height
+        self.max_source_scale = max_source_scale
+        # Keyed by (model_index, target_width); least recently used first.
+        self._scaled: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._prewarmed_widths: tuple[int, ...] = ()
+
+    def target_width(self, model_index: int, lane: Lane) -> int:
+        """
+        Return the width model `model_index` is scaled to for `lane`.
+
+        Args:
+            model_index (int): Index into `models`.
+            lane (Lane): Target lane where the sprite will spawn.
+
+        Returns:
+            int: Sprite width in pixels.
+        """
+        lane_fit_width = max(1, lane.width - 20)
+        target_width = min(lane_fit_width, int(lane.width * self.lane_width_ratio))
+        target_width = max(config.TRAFFIC_MIN_SIZE, target_width)
+        if self.max_source_scale is not None:
+            source_width = self.models[model_index].get_width()
+            target_width = min(
+                target_width,
+                max(
+                    config.TRAFFIC_MIN_SIZE,
+                    int(source_width * self.max_source_scale),
+                ),
+            )
+        return target_width
+
+    def scaled(self, model_index: int, lane: Lane) -> pygame.Surface:
+        """
+        Return model `model_index` scaled for `lane`, caching the result.
+
+        The cache keeps the `config.MODEL_SCALE_CACHE_SIZE` most recently used
+        sizes.
+        """
+        target_width = self.target_width(model_index, lane)
+        cache_key = (model_index, target_width)
+        cached = self._scaled.get(cache_key)
+        if cached is not None:
+            self._scaled.move_to_end(cache_key)
+            return cached
+
+        source = self.models[model_index]
+        source_width, source_height = source.get_size()
+        scaled_height = max(
+            self.min_height, int(source_height * (target_width / source_width))
+        )
+        scaled = pygame.transform.smoothscale(source, (target_width, scaled_height))
+        self._scaled[cache_key] = scaled
+        if len(self._scaled) > config.MODEL_SCALE_CACHE_SIZE:
+            self._scaled.popitem(last=False)
+        return scaled
+
+    def prewarm(self, road: Road) -> None:
+        """
+        Scale every model for every lane of `road` up front.
+
+        Call again after the lane count changes so the first spawn at a new
+        lane width does not stall on `smoothscale`. Does nothing while the
+        lane widths match the last call.
+        """
+        lanes = [road.get_lane(lane_index) for lane_index in range(road.lane_count)]
+        widths = tuple(lane.width for lane in lanes)
+        if widths == self._prewarmed_widths:
+            return
+        self._prewarmed_widths = widths
+        for lane in lanes:
+            for model_index in range(len(self.models)):
+                self.scaled(model_index, lane)
+
+
+def sprite_rects(*groups: pygame.sprite.Group) -> list[pygame.Rect]:
+    """
+    Return the rects of every sprite in `groups`.
+
+    Existing sprites do not move between spawn attempts, so managers collect
+    these once per spawn and probe them with `Rect.collidelist`.
+    """
+    return [sprite.rect for group in groups for sprite in group]
+
+
+def spacing_rect(x: int, y: int, width: int, height: int) -> pygame.Rect:
+    """
+    Return the probe a spawn at `(x, y)` must keep clear of nearby sprites.
+
+    A same-height sprite in the column collides with it when its top is
+    within three spawn heights of `y`.
+
+    Args:
+        x (int): Spawn left edge.
+        y (int): Spawn top edge.
+        width (int): Spawn width in pixels.
+        height (int): Spawn height in pixels.
+
+    Returns:
+        pygame.Rect: Spawn rect grown by two heights above and below.
+    """
+    return pygame.Rect(x, y, width, height).inflate(0, height * 4)
+
+
+def column_rect(x: int, width: int) -> pygame.Rect:
+    """
+    Return a probe rect spanning `[x, x + width)` at effectively any height.
+
+    `collidelist` against it is an x-only overlap test.
+    """
+    return pygame.Rect(x, -_COLUMN_EXTENT, width, 2 * _COLUMN_EXTENT)
+
+
+def scroll_with_map(
+        group: pygame.sprite.Group, map_speed: int, screen_height: int
+) -> None:
+    """
+    Scroll map-bound hazards in `group` by `map_speed`.
+
+    These hazards only move with the map; while the car is stopped none of
+    them can move or leave the screen, so the per-sprite calls are skipped.
+    """
+    if map_speed > 0:
+        group.update(map_speed, screen_height)
@@ -0,0 +1,111 @@
+import numpy as np
+
+from jit import njit
+
+# Landmark indices from the MediaPipe hand model.
+WRIST = 0
+THUMB_MCP = 2
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_PIP = 6
+INDEX_TIP = 8
+# Fingertips and the PIP joints below them: index, middle, ring, pinky.
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_PIPS = np.array([6, 10, 14, 18])
+
+
+def landmarks_to_array(hand_landmarks) -> np.ndarray:
+    """
+    Copy one hand's normalized landmarks into a `(21, 2)` float64 array.
+
+    Rows follow MediaPipe landmark order and columns are `(x, y)`. Build this
+    once per hand per frame and pass it to every predicate below.
+    """
+    # fromiter with a known count fills the array directly, skipping the
+    # intermediate list of tuples.
+    return np.fromiter(
+        (value for lm in hand_landmarks for value in (lm.x, lm.y)),
+        dtype=np.float64,
+        count=2 * len(hand_landmarks),
+    ).reshape(-1, 2)
+
+
+@njit("boolean(float64[:, ::1], int64, int64)", cache=True)
+def _curled_at_least(lm, first, needed):
+    """
+    Return whether at least `needed` fingers from `first` on are curled.
+
+    Stops as soon as the answer is known, either because enough fingers are
+    curled or because too few remain to reach `needed`.
+    """
+    curled = 0
+    remaining = FINGER_TIPS.shape[0] - first
+    for i in range(first, FINGER_TIPS.shape[0]):
+        remaining -= 1
+        if lm[FINGER_TIPS[i], 1] > lm[FINGER_PIPS[i], 1]:
+            curled += 1
+            if curled >= needed:
+                return True
+        elif curled + remaining < needed:
+            return False
+    return curled >= needed
+
+
+@njit("boolean(float64[:, ::1])", cache=True)
+def is_index_only(lm):
+    """
+    Detect a "pointer finger" gesture for L1/R1 style shifting.
+
+    The index finger must be extended while most other fingers stay curled.
+    """
+    if not (lm[INDEX_TIP, 1] < lm[INDEX_PIP, 1] < lm[INDEX_MCP, 1]):
+        return False
+    # Middle, ring, and pinky only
+    return _curled_at_least(lm, 1, 2)
+
+
+@njit("boolean(float64[:, ::1])", cache=True)
+def is_thumb_up(lm):
+    """Detect a thumbs-up gesture used to trigger boost."""
+    if not lm[THUMB_TIP, 1] < lm[THUMB_MCP, 1]:
+        return False
+    return _curled_at_least(lm, 0, 3)
+
+
+@njit("boolean(float64[:, ::1])", cache=True)
+def is_index_closed(lm):
+    """Detect a deliberate "index finger down" pose with stricter checks."""
+    tip_below_pip = lm[INDEX_TIP, 1] > (lm[INDEX_PIP, 1] + 0.03)
+    tip_below_mcp = lm[INDEX_TIP, 1] > (lm[INDEX_MCP, 1] + 0.05)
+    pip_below_mcp = lm[INDEX_PIP, 1] > (lm[INDEX_MCP, 1] + 0.01)
+    return tip_below_pip and tip_below_mcp and pip_below_mcp
+
+
+@njit("float64(float64[:, ::1], float64[:, ::1])", cache=True)
+def compute_steer(left, right):
+    """Compute clamped steering slope from wrist alignment."""
+    slope = (right[WRIST, 1] - left[WRIST, 1]) / (
+        right[WRIST, 0] - left[WRIST, 0] + 1e-6
+    )
+    # Inline bounds: without Numba this avoids the min()/max() builtin calls.
+    return 5.0 if slope > 5.0 else (-5.0 if slope < -5.0 else slope)
+
+
+@njit(
+    "Tuple((boolean, boolean, boolean, float64))(float64[:, ::1], float64[:, ::1])",
+    cache=True,
+)
+def classify_two_hands(left, right):
+    """
+    Evaluate every two-hand driving gesture in one call.
+
+    Returns:
+        tuple[bool, bool, bool, float]: Left index-only pose, right
+        index-only pose, left thumbs-up, and the steering slope.
+    """
+    return (
+        is_index_only(left),
+        is_index_only(right),
+        is_thumb_up(left),
+        compute_steer(left, right),
+    )
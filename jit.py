@@ -0,0 +1,6 @@
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; decorated kernels run as plain Python without it.
+    def njit(*_args, **_kwargs):
+        """Stand in for `numba.njit`, returning the function unchanged."""
+        return lambda func: func
@@ -53,6 +53,21 @@ def key_to_option_index(event_key: int) -> int | None:
     return key_map.get(event_key)
 
 
+def collide_rect_then_mask(
+    left: pygame.sprite.Sprite, right: pygame.sprite.Sprite
+) -> bool:
+    """
+    Pixel-accurate sprite collision that rejects non-overlapping rects first.
+
+    The AABB test is a single C call; the mask overlap only runs for the few
+    sprites whose rects actually touch the player.
+    """
+    return (
+        left.rect.colliderect(right.rect)
+        and pygame.sprite.collide_mask(left, right) is not None
+    )
+
+
 def main():
     """
     Initialize the game and run the main loop.
@@ -305,7 +320,7 @@ def main():
             player_car.turn(max(-2, min(target_steer, 2)), player_car.turn_smoothing)
 
             # Apply boost to acceleration and max speed if active
-            acceleration = settings.ACCELERATION * gear_accel_ratio[current_gear]
+            acceleration = settings.physics.acceleration * gear_accel_ratio[current_gear]
             max_speed = player_car.max_speed * gear_speed_ratio[current_gear]
             if boost_active:
                 acceleration *= 3  # 3x acceleration
@@ -316,9 +331,8 @@ def main():
                 is_braking=is_breaking,
                 max_speed=max_speed,
                 acceleration=acceleration,
-                friction=settings.FRICTION,
-                brake_strength=settings.BRAKE_STRENGTH,
                 screen_width=WINDOW_SIZE["width"],
+                physics=settings.physics,
             )
 
             game_map.speed = float(player_car.current_speed)
@@ -341,7 +355,7 @@ def main():
                 player_car,
                 game_map.obstacles,
                 True,
-                collided=pygame.sprite.collide_mask,
+                collided=collide_rect_then_mask,
             ):
                 player_car.current_speed = 0
                 player_car.velocity_x = 0
@@ -353,7 +367,7 @@ def main():
                 player_car,
                 game_map.cracks,
                 True,
-                collided=pygame.sprite.collide_mask,
+                collided=collide_rect_then_mask,
             )
             if crack_hits:
                 out_of_control_until = now + 1000
@@ -366,14 +380,14 @@ def main():
                 player_car,
                 game_map.brs,
                 True,
-                collided=pygame.sprite.collide_mask,
+                collided=collide_rect_then_mask,
             )
 
             oil_hits = pygame.sprite.spritecollide(
                 player_car,
                 game_map.oil_spills,
                 True,
-                collided=pygame.sprite.collide_mask,
+                collided=collide_rect_then_mask,
             )
             if oil_hits:
                 if now >= oil_swerve_until:
@@ -391,7 +405,9 @@ def main():
 
         # Drawing
         game_map.draw(screen)
-        sprite_group.draw(screen)
+        # Vehicle frames are premultiplied (see models.vehicle), which takes
+        # SDL's cheaper blend path
+        sprite_group.draw(screen, special_flags=pygame.BLEND_PREMULTIPLIED)
 
         fps = clock.get_fps()
         hud.update_from_game(
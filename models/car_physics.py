@@ -0,0 +1,56 @@
+from jit import njit
+
+
+@njit(
+    "Tuple((float64, float64, float64, int64))("
+    "float64, float64, float64, float64, boolean, float64, float64, "
+    "float64, float64, float64, float64, int64, int64)",
+    cache=True,
+)
+def step_car(
+        speed,
+        velocity_x,
+        x,
+        steering,
+        is_braking,
+        max_speed,
+        acceleration,
+        friction,
+        brake_strength,
+        min_effective_speed,
+        smoothing,
+        width,
+        screen_width,
+):
+    """
+    Advance one frame of car physics on plain scalars.
+
+    Takes no pygame objects so it can be compiled on its own; the explicit
+    signature makes the compile (or cache load) happen at import rather than
+    on the first game frame. Callers copy `rect_x` back onto their sprite.
+
+    Returns:
+        tuple[float, float, float, int]: `(speed, velocity_x, x, rect_x)`.
+    """
+    # Written as min/max and conditional selects instead of if-blocks so the
+    # compiled kernel has no data-dependent branches.
+    max_speed_ref = max(1.0, max_speed)
+    speed_ratio = min(max(speed / max_speed_ref, 0.0), 1.0)
+    dynamic_brake = brake_strength * (0.35 + (0.65 * speed_ratio))
+    speed_delta = -dynamic_brake if is_braking else acceleration
+    speed = min(max(speed + speed_delta - friction, 0.0), max_speed)
+
+    effective_speed = max(speed, min_effective_speed)
+
+    # Smooth interpolation
+    velocity_x += (steering * effective_speed - velocity_x) * smoothing
+
+    # Apply movement with float precision, clamped to the screen
+    x += velocity_x
+    unclamped_x = int(x)
+    rect_x = min(max(unclamped_x, 0), screen_width - width)
+    hit_edge = rect_x != unclamped_x
+    x = float(rect_x) if hit_edge else x
+    velocity_x = 0.0 if hit_edge else velocity_x
+
+    return speed, velocity_x, x, rect_x
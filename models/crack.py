@@ -1,5 +1,14 @@
 import pygame
 
+from models.fallback import fallback_image
+from models.sprite_masks import mask_for
+
+
+def _paint_fallback(image: pygame.Surface) -> None:
+    """Draw the placeholder used when no crack model is available."""
+    pygame.draw.ellipse(image, (35, 35, 35), image.get_rect())
+
+
 class Crack(pygame.sprite.Sprite):
     """Road crack hazard that scrolls toward the player."""
 
@@ -13,8 +22,7 @@ class Crack(pygame.sprite.Sprite):
     ):
         super().__init__()
         if image is None:
-            self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-            pygame.draw.ellipse(self.image, (35, 35, 35), (0, 0, width, height))
+            self.image = fallback_image(width, height, _paint_fallback)
         else:
             if image.get_width() != width or image.get_height() != height:
                 self.image = pygame.transform.smoothscale(image, (width, height))
@@ -22,7 +30,7 @@ class Crack(pygame.sprite.Sprite):
                 self.image = image
 
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = mask_for(self.image)
         self._y_pos = float(y)
 
     def update(self, map_speed: int, screen_height: int) -> None:
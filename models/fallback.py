@@ -0,0 +1,33 @@
+from collections.abc import Callable
+
+import pygame
+
+# Procedural sprites shared by painter and size; they are never drawn on after
+# creation.
+_images: dict[
+    tuple[Callable[[pygame.Surface], None], int, int], pygame.Surface
+] = {}
+
+
+def fallback_image(
+        width: int, height: int, paint: Callable[[pygame.Surface], None]
+) -> pygame.Surface:
+    """
+    Return the shared procedural sprite for a size, drawing it on first use.
+
+    Args:
+        width (int): Sprite width in pixels.
+        height (int): Sprite height in pixels.
+        paint (Callable[[pygame.Surface], None]): Draws the placeholder onto a
+            blank transparent surface of that size.
+
+    Returns:
+        pygame.Surface: Cached sprite image that must not be modified.
+    """
+    key = (paint, width, height)
+    image = _images.get(key)
+    if image is None:
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        paint(image)
+        _images[key] = image
+    return image
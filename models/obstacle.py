@@ -1,5 +1,15 @@
 import pygame
 
+from models.fallback import fallback_image
+from models.sprite_masks import mask_for
+
+
+def _paint_fallback(image: pygame.Surface) -> None:
+    """Draw the placeholder used when no obstacle model is available."""
+    image.fill((255, 50, 50))
+    pygame.draw.rect(image, (255, 255, 0), (0, 0, image.get_width(), 10))
+
+
 class Obstacle(pygame.sprite.Sprite):
     def __init__(
             self,
@@ -26,9 +36,7 @@ class Obstacle(pygame.sprite.Sprite):
         super().__init__()
         # Always create the image at the correct size for the obstacle
         if image is None:
-            self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-            self.image.fill((255, 50, 50))
-            pygame.draw.rect(self.image, (255, 255, 0), (0, 0, width, 10))
+            self.image = fallback_image(width, height, _paint_fallback)
         else:
             # Defensive: ensure the image is the correct size for the rect
             if image.get_width() != width or image.get_height() != height:
@@ -40,7 +48,7 @@ class Obstacle(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
         # Always update the mask after scaling
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = mask_for(self.image)
         self.speed = float(speed)
         # Per-vehicle base approach speed so traffic always moves on-screen.
         self.traffic_speed = max(0.5, float(traffic_speed))
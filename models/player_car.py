@@ -1,5 +1,8 @@
 import pygame
 
+import config
+from config import CarPhysics
+from models.car_physics import step_car
 from models.vehicle import Vehicle
 
 
@@ -27,51 +30,38 @@ class PlayerCar(Vehicle):
             is_braking,
             max_speed,
             acceleration,
-            friction,
-            brake_strength,
             screen_width,
+            physics: CarPhysics = config.CAR_PHYSICS,
     ):
         """
         Update the car's speed and position for a frame.
 
         Applies acceleration/braking and friction, clamps to bounds, smooths the
         steering response, and keeps the car within the screen width.
-        """
-        if is_braking:
-            max_speed_ref = max(1.0, float(max_speed))
-            speed_ratio = max(0.0, min(1.0, self.current_speed / max_speed_ref))
-            dynamic_brake = float(brake_strength) * (0.35 + (0.65 * speed_ratio))
-            self.current_speed -= dynamic_brake
-        else:
-            self.current_speed += acceleration
-
-        self.current_speed -= friction
-
-        # Clamp Speed
-        if self.current_speed < 0:
-            self.current_speed = 0
-        if self.current_speed > max_speed:
-            self.current_speed = max_speed
-
-        effective_speed = max(self.current_speed, 2)
-        target_vx = steering * effective_speed
-
-        # Smooth interpolation
-        self.velocity_x += (target_vx - self.velocity_x) * self.smoothing
-
-        # Apply movement with float precision
-        self.x += self.velocity_x
-        self.rect.x = int(self.x)
 
-        # Boundaries
-        if self.rect.left < 0:
-            self.rect.left = 0
-            self.x = float(self.rect.x)
-            self.velocity_x = 0
-        if self.rect.right > screen_width:
-            self.rect.right = screen_width
-            self.x = float(self.rect.x)
-            self.velocity_x = 0
+        Args:
+            physics (CarPhysics): Fixed friction/brake tuning; `max_speed` and
+                `acceleration` stay per-frame since gears and boost change them.
+        """
+        rect = self.rect
+        speed, velocity_x, x, rect.x = step_car(
+            self.current_speed,
+            self.velocity_x,
+            self.x,
+            steering,
+            bool(is_braking),
+            max_speed,
+            acceleration,
+            physics.friction,
+            physics.brake_strength,
+            physics.min_effective_speed,
+            self.smoothing,
+            rect.width,
+            screen_width,
+        )
+        self.current_speed = speed
+        self.velocity_x = velocity_x
+        self.x = x
 
     def set_max_speed(self, max_speed):
         self.max_speed = max_speed
@@ -0,0 +1,29 @@
+import weakref
+
+import pygame
+
+# Hazard sprites share their scaled images, so they can share masks too. Weak
+# keys let a mask go away with its image when a scale cache evicts it.
+_masks: "weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def mask_for(image: pygame.Surface) -> pygame.mask.Mask:
+    """
+    Return the collision mask for `image`, building it on first use.
+
+    The mask is shared by every sprite using the same surface and must not be
+    modified.
+
+    Args:
+        image (pygame.Surface): Sprite image the mask is built from.
+
+    Returns:
+        pygame.mask.Mask: Cached mask of the image's opaque pixels.
+    """
+    mask = _masks.get(image)
+    if mask is None:
+        mask = pygame.mask.from_surface(image)
+        _masks[image] = mask
+    return mask
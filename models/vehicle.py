@@ -1,7 +1,57 @@
+import functools
+
 import pygame
 
 import config
 
+ROTATION_STEP_DEG = 1
+MAX_ROTATION_DEG = int(config.CAR_PHYSICS.max_turn_angle)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_scaled(image_path: str, width: int, height: int) -> pygame.Surface:
+    """
+    Decode and scale a vehicle image once per `(path, size)`.
+
+    The returned surface is shared between vehicles and must not be drawn on.
+    Call only after `pygame.display.set_mode` so `convert_alpha()` matches the
+    display pixel format.
+    """
+    return pygame.transform.scale(
+        pygame.image.load(image_path).convert_alpha(), (width, height)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _rotation_frames(
+        image_path: str, width: int, height: int
+) -> list[tuple[pygame.Surface, pygame.mask.Mask]]:
+    """
+    Pre-rotate a vehicle image across the steering range.
+
+    Uses `rotozoom` for filtered edges; the extra cost is paid once here
+    rather than per frame. Frames are stored with premultiplied alpha, so
+    draw them with `special_flags=pygame.BLEND_PREMULTIPLIED`.
+
+    Returns:
+        list[tuple[pygame.Surface, pygame.mask.Mask]]: Rotated image and its
+        collision mask per `ROTATION_STEP_DEG` step, starting at
+        `-MAX_ROTATION_DEG`.
+    """
+    source = _load_scaled(image_path, width, height)
+    frames = []
+    for angle in range(-MAX_ROTATION_DEG, MAX_ROTATION_DEG + 1, ROTATION_STEP_DEG):
+        rotated = pygame.transform.rotozoom(source, angle, 1.0).convert_alpha()
+        frames.append((rotated.premul_alpha(), pygame.mask.from_surface(rotated)))
+    return frames
+
+
+def _frame_index(angle: float) -> int:
+    """Return the `_rotation_frames` index nearest to `angle`, clamped to range."""
+    snapped = round(angle / ROTATION_STEP_DEG)
+    limit = MAX_ROTATION_DEG // ROTATION_STEP_DEG
+    return max(-limit, min(limit, snapped)) + limit
+
 
 class Vehicle(pygame.sprite.Sprite):
     def __init__(
@@ -18,13 +68,11 @@ class Vehicle(pygame.sprite.Sprite):
         super().__init__()
         self.width = width
         self.height = height
-        self.image = pygame.transform.scale(
-            pygame.image.load(image_path).convert_alpha(), (self.width, self.height)
-        )
-        self.original_image = self.image.copy()
+        self.original_image = _load_scaled(image_path, self.width, self.height)
+        self._rotations = _rotation_frames(image_path, self.width, self.height)
+        self.image, self.mask = self._rotations[_frame_index(0.0)]
         self.rect = self.image.get_rect()
         self.rect.center = (start_x, start_y)
-        self.mask = pygame.mask.from_surface(self.image)
         self.steer = 0.0
         self.current_angle = 0.0
 
@@ -45,7 +93,8 @@ class Vehicle(pygame.sprite.Sprite):
             # Instant turn (no smoothing)
             self.current_angle = target_angle
 
-        self.image = pygame.transform.rotate(self.original_image, self.current_angle)
+        # Snap to the nearest pre-rotated frame; the smoothed angle itself
+        # stays continuous.
+        self.image, self.mask = self._rotations[_frame_index(self.current_angle)]
         self.rect = self.image.get_rect(center=self.rect.center)
-        self.mask = pygame.mask.from_surface(self.image)
         self.steer = self.current_angle
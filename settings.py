@@ -4,12 +4,10 @@ import cv2
 import pygame
 
 from config import (
-    ACCELERATION,
     AVAILABLE_FPS,
     BRAKE_SENSITIVITY,
-    BRAKE_STRENGTH,
+    CAR_PHYSICS,
     CAR_SPEED,
-    FRICTION,
     LANE_COUNT,
     MAX_LANE_COUNT,
     MAX_FPS,
@@ -36,9 +34,7 @@ class Settings:
         self._vals = AVAILABLE_FPS
 
         # Physics
-        self.ACCELERATION = ACCELERATION
-        self.FRICTION = FRICTION
-        self.BRAKE_STRENGTH = BRAKE_STRENGTH
+        self.physics = CAR_PHYSICS
         self.brake_sensitivity = BRAKE_SENSITIVITY  # 1 (Hard) to 10 (Easy)
 
         # This
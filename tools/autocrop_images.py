@@ -2,15 +2,94 @@
 """
 Auto-crop images to remove excess whitespace/transparent areas.
 Resizes pictures to fit the edges of the subject.
+
+Decoding, RGBA conversion, and PNG encoding run inside Pillow's C core, so
+installing the Pillow-SIMD build in place of Pillow speeds this tool up
+without code changes: `pip uninstall pillow && pip install pillow-simd`.
 """
 
+import argparse
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+OUTPUT_FORMATS = ("png", "webp")
+
+
+def _content_bbox(pixels):
+    """
+    Find the bounding box of non-transparent pixels.
+
+    Matches PIL's getbbox() on the alpha band.
+
+    Args:
+        pixels: RGBA pixel array of shape (height, width, 4)
 
-def autocrop_image(image_path, output_path=None, padding=0, background_color=(255, 255, 255)):
+    Returns:
+        (x1, y1, x2, y2) box with exclusive right/bottom edges, or None if empty
+    """
+    content = pixels[..., 3] != 0
+
+    rows = content.any(axis=1)
+    if not rows.any():
+        return None
+    y1 = int(rows.argmax())
+    y2 = len(rows) - int(rows[::-1].argmax())
+
+    # Columns only need scanning inside the occupied row band
+    cols = content[y1:y2].any(axis=0)
+    x1 = int(cols.argmax())
+    x2 = len(cols) - int(cols[::-1].argmax())
+    return x1, y1, x2, y2
+
+
+def _encode_cropped(
+    cropped, output_path, source_format, output_format, compress_level, jpeg_quality
+):
+    """
+    Encode a cropped image in memory, picking the container from the source and options.
+
+    Output is lossless unless jpeg_quality is set, in which case JPEG sources
+    are written back as JPEG at that quality instead of as much larger PNGs.
+
+    Returns:
+        (path, data) with the path the image should be written to and its
+        encoded bytes
+    """
+    buffer = io.BytesIO()
+    if output_format == "webp":
+        output_path = output_path.with_suffix(".webp")
+        cropped.save(buffer, "WEBP", lossless=True, method=0)
+    elif source_format == "JPEG" and jpeg_quality is not None:
+        cropped.convert("RGB").save(buffer, "JPEG", quality=jpeg_quality)
+    else:
+        cropped.save(buffer, "PNG", compress_level=compress_level, optimize=False)
+    return output_path, buffer.getbuffer()
+
+
+def _write_bytes(path, data):
+    """Write encoded image bytes to path in a single call."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def autocrop_image(
+    image_path,
+    output_path=None,
+    padding=0,
+    background_color=(255, 255, 255),
+    output_format="png",
+    compress_level=1,
+    jpeg_quality=None,
+    write=_write_bytes,
+):
     """
     Auto-crop an image to remove excess background/whitespace.
 
@@ -19,95 +98,223 @@ def autocrop_image(image_path, output_path=None, padding=0, background_color=(25
         output_path: Optional custom output path (default: same name with _cropped suffix)
         padding: Number of pixels to add around the cropped content (default: 0)
         background_color: RGB tuple for white/background color to remove (default: white)
+        output_format: "png" or "webp" for lossless WebP
+        compress_level: zlib level for PNG output; 1 trades ~10% size for speed
+        jpeg_quality: Re-encode JPEG sources as lossy JPEG at this quality
+            instead of PNG (default: None, lossless)
+        write: Callable taking (path, data) that stores the encoded bytes
+
+    Returns:
+        Status line describing the result, printed by the caller so output
+        from parallel workers does not interleave
     """
     try:
-        # Open image
+        # Decode once into an RGBA array; the bbox scan and the crop both work
+        # on this array, so no band copies or full-size crop image are made
         img = Image.open(image_path)
-
-        # Convert to RGBA to handle transparency
+        source_format = img.format
         if img.mode != "RGBA":
             img = img.convert("RGBA")
+        pixels = np.asarray(img)
 
-        # Get the bounding box of non-transparent content
-        # For images with alpha channel
-        alpha = img.split()[3]
-        bbox = alpha.getbbox()
+        # Get the bounding box of non-transparent content, using one
+        # vectorized pass per axis
+        bbox = _content_bbox(pixels)
 
         if bbox is None:
-            print(f"⚠ No content found in {image_path}, skipping")
-            return
+            return f"⚠ No content found in {image_path}, skipping"
 
         # Add padding if specified
+        height, width = pixels.shape[:2]
         x1, y1, x2, y2 = bbox
         x1 = max(0, x1 - padding)
         y1 = max(0, y1 - padding)
-        x2 = min(img.width, x2 + padding)
-        y2 = min(img.height, y2 + padding)
+        x2 = min(width, x2 + padding)
+        y2 = min(height, y2 + padding)
 
-        # Crop the image
-        cropped = img.crop((x1, y1, x2, y2))
+        # Crop by slicing; only the cropped region is copied into the new image
+        cropped = Image.fromarray(pixels[y1:y2, x1:x2])
 
         # Determine output path
         if output_path is None:
             input_path = Path(image_path)
-            output_path = input_path.parent / f"{input_path.stem}_cropped.png"
+            keep_jpeg = source_format == "JPEG" and jpeg_quality is not None
+            suffix = input_path.suffix if keep_jpeg else ".png"
+            output_path = input_path.parent / f"{input_path.stem}_cropped{suffix}"
         else:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save the cropped image
-        cropped.save(output_path, "PNG")
+        # Encode in memory, then hand the bytes to the writer
+        output_path, data = _encode_cropped(
+            cropped,
+            output_path,
+            source_format,
+            output_format,
+            compress_level,
+            jpeg_quality,
+        )
+        write(output_path, data)
         old_size = Path(image_path).stat().st_size
-        new_size = output_path.stat().st_size
-        print(f"✓ Cropped: {image_path} → {output_path} ({old_size} → {new_size} bytes)")
+        new_size = len(data)
+        return f"✓ Cropped: {image_path} → {output_path} ({old_size} → {new_size} bytes)"
 
     except Exception as e:
-        print(f"✗ Error processing {image_path}: {e}")
+        return f"✗ Error processing {image_path}: {e}"
+
+
+def _iter_image_files(directory):
+    """
+    Yield image files under a directory, skipping earlier _cropped outputs.
+
+    Uses os.scandir so file type checks reuse the directory listing instead
+    of issuing a stat() per entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_image_files(entry.path)
+                continue
+            path = Path(entry.path)
+            if (
+                entry.is_file()
+                and path.suffix.lower() in IMAGE_SUFFIXES
+                and not path.stem.endswith("_cropped")
+            ):
+                yield path
+
+
+def _output_path_for(img_file, input_dir, output_dir):
+    """Map an input image to its output path, adding a _cropped suffix in place."""
+    rel_path = img_file.relative_to(input_dir)
+    if output_dir == input_dir:
+        # For output to same folder, add _cropped suffix
+        return output_dir / rel_path.parent / f"{rel_path.stem}_cropped{rel_path.suffix}"
+    # For different output folder, preserve structure
+    return output_dir / rel_path
+
+
+def _is_up_to_date(img_file, output_path):
+    """Return True if output_path is a non-empty file at least as new as img_file."""
+    try:
+        out_stat = output_path.stat()
+    except FileNotFoundError:
+        return False
+    return out_stat.st_size > 0 and out_stat.st_mtime >= img_file.stat().st_mtime
 
 
 def main():
-    if len(sys.argv) < 2:
-        # Default: crop all PNG files in resources/models recursively
-        input_dir = Path("resources/models")
-        output_dir = input_dir
-    elif len(sys.argv) == 2:
-        # Only input folder provided, output to same location
-        input_dir = Path(sys.argv[1])
-        output_dir = input_dir
-    else:
-        # Both input and output folders provided
-        input_dir = Path(sys.argv[1])
-        output_dir = Path(sys.argv[2])
+    parser = argparse.ArgumentParser(
+        description="Auto-crop images to the edges of their visible content."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        type=Path,
+        default=Path("resources/models"),
+        help="Input directory searched recursively (default: resources/models)",
+    )
+    parser.add_argument(
+        "output",
+        nargs="?",
+        type=Path,
+        help="Output directory (default: same as input, with _cropped suffix)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="png",
+        help="Lossless output format (default: png)",
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="{0..9}",
+        help="PNG zlib compression level (default: 1, fastest useful)",
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        choices=range(1, 96),
+        metavar="{1..95}",
+        help="Re-encode JPEG sources as lossy JPEG at this quality instead of PNG",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-crop images even if their output is already up to date",
+    )
+    args = parser.parse_args()
+
+    input_dir = args.input
+    output_dir = args.output or input_dir
 
     if not input_dir.exists():
         print(f"✗ Input directory not found: {input_dir}")
         sys.exit(1)
 
-    # Recursively find all image files
-    image_files = (
-        list(input_dir.glob("**/*.png"))
-        + list(input_dir.glob("**/*.PNG"))
-        + list(input_dir.glob("**/*.jpg"))
-        + list(input_dir.glob("**/*.jpeg"))
-        + list(input_dir.glob("**/*.JPG"))
-        + list(input_dir.glob("**/*.JPEG"))
-    )
+    if args.jobs < 1:
+        print(f"✗ Jobs must be at least 1, got {args.jobs}")
+        sys.exit(1)
+
+    # Recursively find all image files in a single directory walk
+    image_files = sorted(_iter_image_files(input_dir))
 
     if image_files:
         print(f"Found {len(image_files)} image file(s). Cropping...")
-        for img_file in image_files:
-            # For output to same folder, add _cropped suffix
-            if output_dir == input_dir:
-                rel_path = img_file.relative_to(input_dir)
-                output_path = (
-                    output_dir / rel_path.parent / f"{rel_path.stem}_cropped{rel_path.suffix}"
-                )
-            else:
-                # For different output folder, preserve structure
-                rel_path = img_file.relative_to(input_dir)
-                output_path = output_dir / rel_path
-
-            autocrop_image(img_file, output_path)
+        output_paths = [
+            _output_path_for(img_file, input_dir, output_dir) for img_file in image_files
+        ]
+        if args.format == "webp":
+            output_paths = [path.with_suffix(".webp") for path in output_paths]
+        if not args.force:
+            # Filter before dispatch so the pool only receives real work
+            pending = [
+                (img_file, output_path)
+                for img_file, output_path in zip(image_files, output_paths)
+                if not _is_up_to_date(img_file, output_path)
+            ]
+            skipped = len(image_files) - len(pending)
+            if skipped:
+                print(f"Skipping {skipped} up-to-date image file(s)")
+            image_files = [img_file for img_file, _ in pending]
+            output_paths = [output_path for _, output_path in pending]
+        crop = partial(
+            autocrop_image,
+            output_format=args.format,
+            compress_level=args.compress_level,
+            jpeg_quality=args.jpeg_quality,
+        )
+        if args.jobs == 1:
+            # A writer thread stores each file while the next one is encoded
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending_writes = []
+
+                def write_in_background(path, data):
+                    pending_writes.append((path, writer.submit(_write_bytes, path, data)))
+
+                for status in map(
+                    partial(crop, write=write_in_background), image_files, output_paths
+                ):
+                    print(status)
+                for path, future in pending_writes:
+                    if future.exception() is not None:
+                        print(f"✗ Error writing {path}: {future.exception()}")
+        else:
+            # Each file is independent, so spread decode/encode across cores
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                for status in executor.map(
+                    crop, image_files, output_paths, chunksize=8
+                ):
+                    print(status)
         print("\nDone!")
     else:
         print(f"No image files found in {input_dir}/")
@@ -47,6 +47,9 @@ class PlayerHUD:
         self._accent_color = (0, 200, 255)
         self._warn_color = (255, 80, 80)
         self._muted_color = (120, 120, 120)
+        # Gesture icons only vary by state and size, so each variant is drawn
+        # once and blitted afterwards.
+        self._icon_cache: dict[tuple, pygame.Surface] = {}
 
     def update_from_game(
         self,
@@ -314,37 +317,84 @@ class PlayerHUD:
 
         # Brake / Stop icon.
         if self.is_braking:
-            self._draw_stop_sign(screen, (x, y), size)
+            overhang = self._label_overhang("STOP", size)
+            brake_icon = self._cached_icon(
+                ("stop", size), size, self._draw_stop_sign, overhang
+            )
+            screen.blit(brake_icon, (x - overhang[0], y - overhang[1]))
         else:
-            self._draw_throttle_icon(screen, (x, y), size)
+            brake_icon = self._cached_icon(
+                ("throttle", size), size, self._draw_throttle_icon
+            )
+            screen.blit(brake_icon, (x, y))
 
         # Steering direction icon.
         steer_x = x + size + gap
         if self.steer < -0.6:
-            self._draw_arrow_icon(screen, (steer_x, y), size, direction="left")
+            direction = "left"
         elif self.steer > 0.6:
-            self._draw_arrow_icon(screen, (steer_x, y), size, direction="right")
+            direction = "right"
         else:
-            self._draw_arrow_icon(screen, (steer_x, y), size, direction="center")
+            direction = "center"
+        steer_icon = self._cached_icon(
+            ("arrow", size, direction),
+            size,
+            lambda surf, pos, icon_size: self._draw_arrow_icon(
+                surf, pos, icon_size, direction=direction
+            ),
+        )
+        screen.blit(steer_icon, (steer_x, y))
 
         # Shift gesture status icons: L1 (downshift), R1 (upshift).
         shift_down_x = steer_x + size + gap
         shift_up_x = shift_down_x + size + gap
-        self._draw_shift_icon(
-            screen,
-            (shift_down_x, y),
-            size,
-            label="L1-",
-            active=self.left_shift_active,
-        )
-        self._draw_shift_icon(
-            screen,
-            (shift_up_x, y),
-            size,
-            label="R1+",
-            active=self.right_shift_active,
+        for label, active, icon_x in (
+            ("L1-", self.left_shift_active, shift_down_x),
+            ("R1+", self.right_shift_active, shift_up_x),
+        ):
+            overhang = self._label_overhang(label, size)
+            shift_icon = self._cached_icon(
+                ("shift", size, label, bool(active)),
+                size,
+                lambda surf, pos, icon_size: self._draw_shift_icon(
+                    surf, pos, icon_size, label=label, active=active
+                ),
+                overhang,
+            )
+            screen.blit(shift_icon, (icon_x - overhang[0], y - overhang[1]))
+
+    def _label_overhang(self, label: str, size: int) -> tuple[int, int]:
+        """Return how far `label`, centred on a `size` icon, spills past each edge."""
+        text_width, text_height = self.font.size(label)
+        return (
+            max(0, (text_width - size) // 2 + 1),
+            max(0, (text_height - size) // 2 + 1),
         )
 
+    def _cached_icon(
+        self,
+        key: tuple,
+        size: int,
+        draw,
+        overhang: tuple[int, int] = (0, 0),
+    ) -> pygame.Surface:
+        """
+        Return the icon for `key`, drawing it with `draw(surface, overhang, size)` once.
+
+        `overhang` pads each side of the icon box for drawing that extends past
+        it, so callers blit the result at their top-left minus `overhang`.
+        """
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            pad_x, pad_y = overhang
+            # One extra pixel: the stop sign's polygon reaches x/y == size.
+            icon = pygame.Surface(
+                (size + 1 + 2 * pad_x, size + 1 + 2 * pad_y), pygame.SRCALPHA
+            )
+            draw(icon, overhang, size)
+            self._icon_cache[key] = icon
+        return icon
+
     def _draw_shift_icon(
         self,
         screen: pygame.Surface,